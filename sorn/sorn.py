@@ -97,7 +97,9 @@ class Sorn(object):
             weight_matrix = np.random.uniform(0.0, 0.1, (Sorn.ne, Sorn.ni))
             weight_matrix.reshape((Sorn.ne, Sorn.ni))
 
-        return weight_matrix
+        # Weights live in [0,1]; single precision halves the memory traffic of the plasticity steps.
+        # Column-major so the incoming weights of each post synaptic neuron are contiguous
+        return np.asfortranarray(weight_matrix, dtype=np.float32)
 
     @staticmethod
     def initialize_threshold_matrix(
@@ -116,8 +118,8 @@ class Sorn(object):
             ti (array): Threshold values for inhibitory units
         """
 
-        te = np.random.uniform(te_min, te_max, (Sorn.ne, 1))
-        ti = np.random.uniform(ti_min, ti_max, (Sorn.ni, 1))
+        te = np.random.uniform(te_min, te_max, (Sorn.ne, 1)).astype(np.float32)
+        ti = np.random.uniform(ti_min, ti_max, (Sorn.ni, 1)).astype(np.float32)
 
         return te, ti
 
@@ -133,8 +135,9 @@ class Sorn(object):
             x (array): Array of activity vectors of excitatory population
             y (array): Array of activity vectors of inhibitory population"""
 
-        x = np.zeros((ne, 2))
-        y = np.zeros((ni, 2))
+        # Column-major: activity at t-1 (column 0) and t (column 1) are each contiguous
+        x = np.zeros((ne, 2), dtype=np.float32, order="F")
+        y = np.zeros((ni, 2), dtype=np.float32, order="F")
 
         return x, y
 
@@ -160,6 +163,8 @@ class Plasticity(Sorn):
         )  # Intrinsic plasticity learning rate constant; SORN2 only
         self.h_ip = 2 * Sorn.nu / Sorn.ne  # Target firing rate
         self.mu_ip = Sorn.mu_ip  # Mean target firing rate
+        # Loop invariant of the iSTDP rule, computed once instead of per update
+        self.istdp_factor = 1 + 1 / self.mu_ip
         # Number of inhibitory units in the network
         self.ni = int(0.2 * Sorn.ne)
         self.timesteps = Sorn.timesteps  # Total time steps of simulation
@@ -173,38 +178,38 @@ class Plasticity(Sorn):
             x (array): Excitatory network activity
             cutoff_weights (list): Maximum and minimum weight ranges
         Returns:
-            wee (array):  Weight matrix
+            wee (array):  Weight matrix, updated in place
         """
 
-        x = np.asarray(x)
         xt_1 = x[:, 0]
         xt = x[:, 1]
-        wee_t = wee.copy()
 
         # STDP applies only on the neurons which are connected.
-
-        for i in range(len(wee_t[0])):  # Each neuron i, Post-synaptic neuron
-
-            for j in range(
-                len(wee_t[0:])
-            ):  # Incoming connection from jth pre-synaptic neuron to ith neuron
-
-                if wee_t[j][i] != 0.0:  # Check connectivity
-
-                    # Get the change in weight
-                    delta_wee_t = self.eta_stdp * (xt[i] * xt_1[j] - xt_1[i] * xt[j])
-
-                    # Update the weight between jth neuron to i ""Different from notation in article
-
-                    wee_t[j][i] = wee[j][i] + delta_wee_t
+        # Connection from jth pre-synaptic neuron (row) to ith post-synaptic neuron (column)
+        # The update is non zero only for the spike coincidences pre(t-1) -> post(t)
+        # (potentiation) and pre(t) -> post(t-1) (depression), so the connections are
+        # searched within those two blocks. A synapse in both blocks appears twice,
+        # and both writes below carry the same value
+        active_t_1, active_t = np.flatnonzero(xt_1), np.flatnonzero(xt)
+        ltp_pre, ltp_post = np.nonzero(wee[np.ix_(active_t_1, active_t)])
+        ltd_pre, ltd_post = np.nonzero(wee[np.ix_(active_t, active_t_1)])
+        pre = np.concatenate((active_t_1[ltp_pre], active_t[ltd_pre]))
+        post = np.concatenate((active_t[ltp_post], active_t_1[ltd_post]))
+
+        # Update only the existing synapses instead of the full ne x ne matrix
+        eta = self.eta_stdp
+        w = wee[pre, post] + eta * (xt[post] * xt_1[pre] - xt_1[post] * xt[pre])
 
         # Prune the smallest weights induced by plasticity mechanisms; Apply lower cutoff weight
-        wee_t = Initializer.reset_min(wee_t, cutoff_weights[0])
+        w = Initializer.reset_min(w, cutoff_weights[0])
 
         # Check and set all weights < upper cutoff weight
-        wee_t = Initializer.reset_max(wee_t, cutoff_weights[1])
+        w = Initializer.reset_max(w, cutoff_weights[1])
 
-        return wee_t
+        # Unconnected entries are untouched by STDP, so the cutoffs are applied on the synapses only
+        wee[pre, post] = w
+
+        return wee
 
     def ip(self, te: np.array, x: np.array):
         """Intrinsic Plasiticity mechanism
@@ -249,67 +254,54 @@ class Plasticity(Sorn):
             y (array): Inhibitory network activity
             cutoff_weights (list): Maximum and minimum weight ranges
         Returns:
-            wei (array): Synaptic strengths from inhibitory to excitatory"""
+            wei (array): Synaptic strengths from inhibitory to excitatory, updated in place"""
 
         # Excitatory network activity
-        xt = np.asarray(x)[:, 1]
+        xt = x[:, 1]
 
         # Inhibitory network activity
-        yt_1 = np.asarray(y)[:, 0]
+        yt_1 = y[:, 0]
 
         # iSTDP applies only on the neurons which are connected.
-        wei_t = wei.copy()
-
-        for i in range(
-            len(wei_t[0])
-        ):  # Each neuron i, Post-synaptic neuron: means for each column;
-
-            for j in range(
-                len(wei_t[0:])
-            ):  # Incoming connection from j, pre-synaptic neuron to ith neuron
-
-                if wei_t[j][i] != 0.0:  # Check connectivity
+        # Connection from jth pre-synaptic (row) to ith post-synaptic neuron (column)
+        # The update is non zero only if the pre synaptic neuron fired at t-1, so
+        # yt_1 is 1 for every selected synapse and only xt is gathered
+        active = np.flatnonzero(yt_1)
+        pre, post = np.nonzero(wei[active])
+        pre = active[pre]
 
-                    # Get the change in weight
-                    delta_wei_t = (
-                        -self.eta_inhib * yt_1[j] * (1 - xt[i] * (1 + 1 / self.mu_ip))
-                    )
-
-                    # Update the weight between jth neuron to i ""Different from notation in article
-
-                    wei_t[j][i] = wei[j][i] + delta_wei_t
+        eta, k = self.eta_inhib, self.istdp_factor
+        w = wei[pre, post] - eta * (1 - xt[post] * k)
 
         # Prune the smallest weights induced by plasticity mechanisms; Apply lower cutoff weight
-        wei_t = Initializer.reset_min(wei_t, cutoff_weights[0])
+        w = Initializer.reset_min(w, cutoff_weights[0])
 
         # Check and set all weights < upper cutoff weight
-        wei_t = Initializer.reset_max(wei_t, cutoff_weights[1])
+        w = Initializer.reset_max(w, cutoff_weights[1])
+
+        wei[pre, post] = w
 
-        return wei_t
+        return wei
 
     @staticmethod
-    def structural_plasticity(wee: np.array):
+    def structural_plasticity(wee: np.array, p_c: int = None):
         """Add new connection value to the smallest weight between excitatory units randomly
         Args:
             wee (array): Weight matrix
+            p_c (int, optional): Random integer in [0, 10) drawn ahead by the caller. Drawn here if None
         Returns:
             wee (array):  Weight matrix"""
 
-        p_c = np.random.randint(0, 10, 1)
+        if p_c is None:
+            p_c = np.random.randint(0, 10, 1)
 
         if p_c == 0:  # p_c= 0.1
 
             # Do structural plasticity
-            # Choose the smallest weights randomly from the weight matrix wee
-            indexes = Initializer.get_unconnected_indexes(wee)
-
-            # Choose any idx randomly such that i!=j
-            while True:
-                idx_rand = random.choice(indexes)
-                if idx_rand[0] != idx_rand[1]:
-                    break
-
-            wee[idx_rand[0]][idx_rand[1]] = 0.001
+            # Choose the smallest weights randomly from the weight matrix wee, such that i!=j
+            idx_rand = Initializer.get_random_unconnected_index(wee)
+            if idx_rand is not None:
+                wee[idx_rand[0]][idx_rand[1]] = 0.001
 
         return wee
 
@@ -371,13 +363,13 @@ class Plasticity(Sorn):
 
         # Initializing variables from sorn_initialize.py
 
-        wee = normalized_wee.copy()
-        wei = normalized_wei.copy()
-        wie = normalized_wie.copy()
-        te = te_init.copy()
-        ti = ti_init.copy()
-        x = x_init.copy()
-        y = y_init.copy()
+        wee = normalized_wee.copy(order="K")
+        wei = normalized_wei.copy(order="K")
+        wie = normalized_wie.copy(order="K")
+        te = te_init.copy(order="K")
+        ti = ti_init.copy(order="K")
+        x = x_init.copy(order="K")
+        y = y_init.copy(order="K")
 
         return wee, wei, wie, te, ti, x, y
 
@@ -385,6 +377,10 @@ class Plasticity(Sorn):
 class MatrixCollection(Sorn):
     """Collect all state initialized and updated during simulation(plasiticity and training phases)
 
+    Only the current state is kept; each update replaces it with the state after time step i.
+    The arrays held are the live ones: stdp and istdp update Wee and Wei in place and the
+    simulation reuses the X and Y buffers, so copy them to keep a snapshot
+
     Args:
         phase(str): Training or Plasticity phase
 
@@ -401,68 +397,41 @@ class MatrixCollection(Sorn):
         if self.phase == "plasticity" and self.state == None:
 
             self.timesteps = Sorn.timesteps + 1  # Total training steps
-            self.Wee, self.Wei, self.Wie, self.Te, self.Ti, self.X, self.Y = (
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-            )
             wee, wei, wie, te, ti, x, y = Plasticity.initialize_plasticity()
 
             # Assign initial matrix to the master state
-            self.Wee[0] = wee
-            self.Wei[0] = wei
-            self.Wie[0] = wie
-            self.Te[0] = te
-            self.Ti[0] = ti
-            self.X[0] = x
-            self.Y[0] = y
+            self.Wee = wee
+            self.Wei = wei
+            self.Wie = wie
+            self.Te = te
+            self.Ti = ti
+            self.X = x
+            self.Y = y
 
         elif self.phase == "plasticity" and self.state != None:
 
             self.timesteps = Sorn.timesteps + 1  # Total training steps
-            self.Wee, self.Wei, self.Wie, self.Te, self.Ti, self.X, self.Y = (
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-            )
             # Assign state from plasticity phase to the new master state for training phase
-            self.Wee[0] = state["Wee"]
-            self.Wei[0] = state["Wei"]
-            self.Wie[0] = state["Wie"]
-            self.Te[0] = state["Te"]
-            self.Ti[0] = state["Ti"]
-            self.X[0] = state["X"]
-            self.Y[0] = state["Y"]
+            self.Wee = np.array(state["Wee"], dtype=np.float32, order="F")
+            self.Wei = np.array(state["Wei"], dtype=np.float32, order="F")
+            self.Wie = np.array(state["Wie"], dtype=np.float32, order="F")
+            self.Te = np.asarray(state["Te"], dtype=np.float32)
+            self.Ti = np.asarray(state["Ti"], dtype=np.float32)
+            self.X = np.asfortranarray(state["X"], dtype=np.float32)
+            self.Y = np.asfortranarray(state["Y"], dtype=np.float32)
 
         elif self.phase == "training":
 
             # NOTE:timesteps here is diferent for plasticity and training phase
             self.timesteps = Sorn.timesteps + 1  # Total training steps
-            self.Wee, self.Wei, self.Wie, self.Te, self.Ti, self.X, self.Y = (
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-                [0] * self.timesteps,
-            )
             # Assign state from plasticity phase to new respective state for training phase
-            self.Wee[0] = state["Wee"]
-            self.Wei[0] = state["Wei"]
-            self.Wie[0] = state["Wie"]
-            self.Te[0] = state["Te"]
-            self.Ti[0] = state["Ti"]
-            self.X[0] = state["X"]
-            self.Y[0] = state["Y"]
+            self.Wee = np.array(state["Wee"], dtype=np.float32, order="F")
+            self.Wei = np.array(state["Wei"], dtype=np.float32, order="F")
+            self.Wie = np.array(state["Wie"], dtype=np.float32, order="F")
+            self.Te = np.asarray(state["Te"], dtype=np.float32)
+            self.Ti = np.asarray(state["Ti"], dtype=np.float32)
+            self.X = np.asfortranarray(state["X"], dtype=np.float32)
+            self.Y = np.asfortranarray(state["Y"], dtype=np.float32)
 
     def weight_matrix(self, wee: np.array, wei: np.array, wie: np.array, i: int):
         """Update weight state
@@ -479,9 +448,9 @@ class MatrixCollection(Sorn):
         Returns:
             tuple(array): Weight state Wee, Wei, Wie"""
 
-        self.Wee[i + 1] = wee
-        self.Wei[i + 1] = wei
-        self.Wie[i + 1] = wie
+        self.Wee = wee
+        self.Wei = wei
+        self.Wie = wie
 
         return self.Wee, self.Wei, self.Wie
 
@@ -498,8 +467,8 @@ class MatrixCollection(Sorn):
         Returns:
             tuple(array): Threshold state Te and Ti"""
 
-        self.Te[i + 1] = te
-        self.Ti[i + 1] = ti
+        self.Te = te
+        self.Ti = ti
         return self.Te, self.Ti
 
     def network_activity_t(
@@ -518,30 +487,11 @@ class MatrixCollection(Sorn):
             tuple(array): Updated Excitatory and Inhibitory states
         """
 
-        self.X[i + 1] = excitatory_net
-        self.Y[i + 1] = inhibitory_net
+        self.X = excitatory_net
+        self.Y = inhibitory_net
 
         return self.X, self.Y
 
-    def network_activity_t_1(self, x: np.array, y: np.array, i: int):
-        """Network activity at previous time step
-
-        Args:
-            x(array): Excitatory network activity
-
-            y(array): Inhibitory network activity
-
-            i(int): Time step
-
-        Returns:
-            tuple(array): Previous Excitatory and Inhibitory states
-        """
-        x_1, y_1 = [0] * self.timesteps, [0] * self.timesteps
-        x_1[i] = x
-        y_1[i] = y
-
-        return x_1, y_1
-
 
 class Neurogenesis(Plasticity):
     """
@@ -565,7 +515,7 @@ class Neurogenesis(Plasticity):
             _type_: _description_
         """
 
-        return np.random.uniform(0.0, 0.1, lambd)
+        return np.random.uniform(0.0, 0.1, lambd).astype(np.float32)
 
     def sample_indices(self, pool, weights, synapse="ee", lambd=Sorn.lambda_ee):
         """_summary_
@@ -604,7 +554,7 @@ class Neurogenesis(Plasticity):
                 assert lambd == weights.shape[0]  # Dense connection
 
                 indices = random.sample(list(range(weights.shape[0])), lambd)
-        return indices
+        return np.asarray(indices, dtype=np.intp)
 
     def excitatory(self, wee, wei, wie):
         """_summary_
@@ -631,14 +581,11 @@ class Neurogenesis(Plasticity):
         aff_synapses = self.sample_weights(Sorn.lambda_ee)
 
         # Apppend additional rows (outgoing synapses) and cols (incoming)
-        temp_ee = np.zeros(np.array(wee.shape) + 1)
-        temp_ee[: wee.shape[0], : wee.shape[1]] = wee  # Padding
+        temp_ee = np.pad(wee, ((0, 1), (0, 1)))  # Padding [200,200] -> [201,201]
         # Update outgoing synapses
-        for eff_idx, w in zip(eff_idxs_exc, eff_synapses):
-            temp_ee[-1][eff_idxs_exc] = w
+        temp_ee[-1, eff_idxs_exc] = eff_synapses
         # Update incoming synapses
-        for aff_idx, w in zip(aff_idxs_exc, aff_synapses):
-            temp_ee[aff_idx][-1] = w
+        temp_ee[aff_idxs_exc, -1] = aff_synapses
 
         # Afferent inhibitory connections to the neuron
         # aff_idxs_inh = self.sample_indices(wei, synapse="ei", lambd=Sorn.lambda_ei)
@@ -654,11 +601,9 @@ class Neurogenesis(Plasticity):
         )  # 40% connectivity. I-> E Eg. Wei.shape=[40,200]
         assert len(aff_idxs_inh) == len(aff_synapses_inh), "Synapses size mismatch"
 
-        temp_ei = np.zeros((wei.shape[0], wei.shape[1] + 1))  # [40,201]
-        temp_ei[: wei.shape[0], : wei.shape[1]] = wei  # Padding
+        temp_ei = np.pad(wei, ((0, 0), (0, 1)))  # Padding [40,200] -> [40,201]
         # Update outgoing synapses Wei: sparse inh -> exc synapse
-        for idx, w in zip(aff_idxs_inh, aff_synapses_inh):
-            temp_ei[idx][-1] = w
+        temp_ei[aff_idxs_inh, -1] = aff_synapses_inh
 
         # Excitatory --> Inhibitory
 
@@ -672,8 +617,7 @@ class Neurogenesis(Plasticity):
             lambd=len(eff_idxs_inh)
         )  # 100% connectivity. E-> I Eg. Wie.shape=[200,40]
         assert len(eff_idxs_inh) == len(eff_synapses_inh), "Synapses size mismatch"
-        temp_ie = np.zeros((wie.shape[0] + 1, wie.shape[1]))  # [201,40]
-        temp_ie[: wie.shape[0], : wie.shape[1]] = wie  # Padding
+        temp_ie = np.pad(wie, ((0, 1), (0, 0)))  # Padding [200,40] -> [201,40]
         # Update outgoing synapses Wei: sparse inh -> exc synapse
         temp_ie[-1] = eff_synapses_inh
 
@@ -691,7 +635,8 @@ class Neurogenesis(Plasticity):
             _type_: _description_
         """
         # Initial threshold value for the new neuron
-        thresh = np.append(thresh, random.uniform(0.0, 0.1))[:, None]
+        thresh = np.append(thresh, random.uniform(0.0, 0.1)).astype(thresh.dtype)
+        thresh = thresh[:, None]
         return thresh
 
     def inhibitory(self, wei, wie):
@@ -717,11 +662,9 @@ class Neurogenesis(Plasticity):
         )  # 40% connectivity. I-> E Eg. Wei.shape=[40,200]
         assert len(eff_idxs_exc) == len(eff_synapses_exc), "Synapses size mismatch"
 
-        temp_ei = np.zeros((wei.shape[0] + 1, wei.shape[1]))  # [40,201]
-        temp_ei[: wei.shape[0], : wei.shape[1]] = wei  # Padding
+        temp_ei = np.pad(wei, ((0, 1), (0, 0)))  # Padding [40,200] -> [41,200]
         # Update outgoing synapses Wei: sparse inh -> exc synapse
-        for idx, w in zip(eff_idxs_exc, eff_synapses_exc):
-            temp_ei[-1][idx] = w
+        temp_ei[-1, eff_idxs_exc] = eff_synapses_exc
 
         # Excitatory --> Inhibitory
         # Afferent connections to Inhibitory Pool; Exc->Inh Dense connection
@@ -734,8 +677,7 @@ class Neurogenesis(Plasticity):
             lambd=len(aff_idxs_exc)
         )  # 100% connectivity. E-> I Eg. Wie.shape=[200,40]
         assert len(aff_idxs_exc) == len(aff_synapses_exc), "Synapses size mismatch"
-        temp_ie = np.zeros((wie.shape[0], wie.shape[1] + 1))  # [201,40]
-        temp_ie[: wie.shape[0], : wie.shape[1]] = wie  # Padding
+        temp_ie = np.pad(wie, ((0, 0), (0, 1)))  # Padding [200,40] -> [200,41]
         # Update outgoing synapses Wei: sparse inh -> exc synapse
         temp_ie[:, -1] = aff_synapses_exc
 
@@ -748,9 +690,7 @@ class Neurogenesis(Plasticity):
         if exc_pool:
             self.excitatory_neurogenesis = exc_pool
             # Set initial state of new exc neuron
-            x_temp = np.zeros(np.array(x_buffer.shape) + 1)
-            x_temp[: x_buffer.shape[0], : x_buffer.shape[1]] = x_buffer
-            x_buffer = x_temp.copy()
+            x_buffer = np.pad(x_buffer, ((0, 1), (0, 0)))
 
             # Set efferent and afferent synapses and threshold
             wee, wei, wie = self.excitatory(wee, wei, wie)
@@ -760,9 +700,7 @@ class Neurogenesis(Plasticity):
             self.inhibitory_neurogenesis = inh_pool
 
             # Set initial state of new inh neuron
-            y_temp = np.zeros(np.array(y_buffer.shape) + 1)
-            y_temp[: y_buffer.shape[0], : y_buffer.shape[1]] = y_buffer
-            y_buffer = y_temp.copy()
+            y_buffer = np.pad(y_buffer, ((0, 1), (0, 0)))
 
             # Set efferent and afferent synapses and threshold
             wei, wie = self.inhibitory(wei, wie)
@@ -776,22 +714,33 @@ class NetworkState(Plasticity):
     """The evolution of network states
 
     Args:
-        v_t(array): External input/stimuli
+        v_t(array, optional): External input/stimuli. Defaults to None; set later with set_input
 
     Returns:
         instance(object): NetworkState instance"""
 
-    def __init__(self, v_t: np.array):
+    def __init__(self, v_t: np.array = None):
         super().__init__()
-        self.v_t = v_t
+        self.v_t = None
+        if v_t is not None:
+            self.set_input(v_t)
+
+    def set_input(self, v_t: np.array):
+        """Set the external input at the current time step, so that a single instance is reused
+        across the time steps
+
+        Args:
+            v_t(array): External input/stimuli
+        """
         assert Sorn.nu == len(
-            self.v_t
-        ), "Input units and input size mismatch: {} != {}".format(
-            Sorn.nu, len(self.v_t)
-        )
-        if Sorn.nu != Sorn.ne:
-            self.v_t = list(self.v_t) + [0.0] * (Sorn.ne - Sorn.nu)
-        self.v_t = np.expand_dims(self.v_t, 1)
+            v_t
+        ), "Input units and input size mismatch: {} != {}".format(Sorn.nu, len(v_t))
+
+        # Zero padded input to the reservoir size, written into a preallocated buffer.
+        # Reallocated only when the reservoir grows
+        if self.v_t is None or self.v_t.shape[0] != Sorn.ne:
+            self.v_t = np.zeros(Sorn.ne, dtype=np.float32)
+        self.v_t[: Sorn.nu] = v_t
 
     def incoming_drive(self, weights: np.array, activity_vector: np.array):
         """Excitatory Post synaptic potential towards neurons in the reservoir in the absence of external input
@@ -804,8 +753,9 @@ class NetworkState(Plasticity):
         Returns:
             incoming(array): Excitatory Post synaptic potential towards neurons
         """
-        incoming = weights * activity_vector
-        incoming = np.array(incoming.sum(axis=0))
+        # Column j collects the incoming connections of neuron j; a single GEMV instead of
+        # broadcasting the weights against the activity and reducing the temporary matrix
+        incoming = weights.T @ activity_vector
         return incoming
 
     def excitatory_network_state(
@@ -835,27 +785,23 @@ class NetworkState(Plasticity):
         Returns:
             x(array): Current Excitatory network activity
         """
-        xt = x[:, 1][:, None]
-        yt = y[:, 1][:, None]
-
-        incoming_drive_e = np.expand_dims(
-            self.incoming_drive(weights=wee, activity_vector=xt), 1
-        )
-        incoming_drive_i = np.expand_dims(
-            self.incoming_drive(weights=wei, activity_vector=yt), 1
-        )
-        tot_incoming_drive = (
-            incoming_drive_e
-            - incoming_drive_i
-            + white_noise_e
-            + np.asarray(self.v_t)
-            - te
-        )
-
-        # Heaviside step function
-        heaviside_step = np.expand_dims([0.0] * len(tot_incoming_drive), 1)
-        heaviside_step[tot_incoming_drive > 0] = 1.0
-        return heaviside_step
+        # 1-D views of the activity at t keep the drives on the BLAS GEMV path
+        xt = x[:, 1]
+        yt = y[:, 1]
+
+        incoming_drive_e = self.incoming_drive(weights=wee, activity_vector=xt)
+        incoming_drive_i = self.incoming_drive(weights=wei, activity_vector=yt)
+        # Accumulate the total drive in place on the fresh GEMV output, so the chain of
+        # element-wise terms does not allocate a temporary per operation
+        tot_incoming_drive = incoming_drive_e
+        tot_incoming_drive -= incoming_drive_i
+        tot_incoming_drive += np.ravel(white_noise_e)
+        tot_incoming_drive += self.v_t
+        tot_incoming_drive -= np.ravel(te)
+
+        # Heaviside step function, returned as a column vector
+        heaviside_step = (tot_incoming_drive > 0).astype(np.float32)
+        return heaviside_step[:, None]
 
     def inhibitory_network_state(
         self, wie: np.array, ti: np.array, y: np.array, white_noise_i: np.array
@@ -876,17 +822,15 @@ class NetworkState(Plasticity):
         Returns:
             y(array): Current Inhibitory network activity"""
 
-        wie = np.asarray(wie)
-        yt = y[:, 1][:, None]
-        incoming_drive_e = np.expand_dims(
-            self.incoming_drive(weights=wie, activity_vector=yt), 1
-        )
+        yt = y[:, 1]
+        incoming_drive_e = self.incoming_drive(weights=wie, activity_vector=yt)
 
-        tot_incoming_drive = incoming_drive_e + white_noise_i - ti
-        heaviside_step = np.expand_dims([0.0] * len(tot_incoming_drive), 1)
-        heaviside_step[tot_incoming_drive > 0] = 1.0
+        tot_incoming_drive = incoming_drive_e
+        tot_incoming_drive += np.ravel(white_noise_i)
+        tot_incoming_drive -= np.ravel(ti)
+        heaviside_step = (tot_incoming_drive > 0).astype(np.float32)
 
-        return heaviside_step
+        return heaviside_step[:, None]
 
     def recurrent_drive(
         self,
@@ -916,23 +860,105 @@ class NetworkState(Plasticity):
         Returns:
             xt(array): Recurrent network state
         """
-        xt = x[:, 1][:, None]
-        yt = y[:, 1][:, None]
+        xt = x[:, 1]
+        yt = y[:, 1]
 
-        incoming_drive_e = np.expand_dims(
-            self.incoming_drive(weights=wee, activity_vector=xt), 1
-        )
+        incoming_drive_e = self.incoming_drive(weights=wee, activity_vector=xt)
 
-        incoming_drive_i = np.expand_dims(
-            self.incoming_drive(weights=wei, activity_vector=yt), 1
-        )
+        incoming_drive_i = self.incoming_drive(weights=wei, activity_vector=yt)
 
-        tot_incoming_drive = incoming_drive_e - incoming_drive_i + white_noise_e - te
+        tot_incoming_drive = incoming_drive_e
+        tot_incoming_drive -= incoming_drive_i
+        tot_incoming_drive += np.ravel(white_noise_e)
+        tot_incoming_drive -= np.ravel(te)
 
-        heaviside_step = np.expand_dims([0.0] * len(tot_incoming_drive), 1)
-        heaviside_step[tot_incoming_drive > 0] = 1.0
+        # Heaviside step function, returned as a column vector
+        heaviside_step = (tot_incoming_drive > 0).astype(np.float32)
 
-        return heaviside_step
+        return heaviside_step[:, None]
+
+    def step(
+        self,
+        wee: np.array,
+        wei: np.array,
+        wie: np.array,
+        te: np.array,
+        ti: np.array,
+        x: np.array,
+        y: np.array,
+        white_noise_e: np.array,
+        white_noise_i: np.array,
+        xt_out: np.array = None,
+        yt_out: np.array = None,
+        recurrent: bool = True,
+    ):
+        """Recurrent drive, Excitatory and Inhibitory network states at time t+1 in a single pass.
+        The recurrent and excitatory states share the E-E and I-E incoming drives, which are computed once
+
+        Args:
+            wee(array): Excitatory-Excitatory weight matrix
+
+            wei(array): Inhibitory-Excitatory weight matrix
+
+            wie(array): Excitatory-Inhibitory weight matrix
+
+            te(array): Excitatory threshold
+
+            ti(array): Inhibitory threshold
+
+            x(array): Excitatory network activity
+
+            y(array): Inhibitory network activity
+
+            white_noise_e(array): Gaussian noise for excitatory units
+
+            white_noise_i(array): Gaussian noise for inhibitory units
+
+            xt_out(array, optional): Array of shape (ne,) to write the Excitatory activity into. Defaults to None.
+
+            yt_out(array, optional): Array of shape (ni,) to write the Inhibitory activity into. Defaults to None.
+
+            recurrent(bool, optional): Whether to compute the recurrent network state. Defaults to True.
+
+        Returns:
+            r(array): Recurrent network state of shape (ne,), None if recurrent is False
+
+            xt(array): Current Excitatory network activity of shape (ne,)
+
+            yt(array): Current Inhibitory network activity of shape (ni,)
+        """
+        # 1-D views of the activity at t keep the drives on the BLAS GEMV path
+        xt = x[:, 1]
+        yt = y[:, 1]
+        te, ti = np.ravel(te), np.ravel(ti)
+
+        # All the drives are computed from the activity at t before any state is written,
+        # so the outputs may be views of the activity buffers
+        incoming_drive_e = self.incoming_drive(weights=wee, activity_vector=xt)
+        incoming_drive_e -= self.incoming_drive(weights=wei, activity_vector=yt)
+        incoming_drive_e += np.ravel(white_noise_e)
+
+        incoming_drive_i = self.incoming_drive(weights=wie, activity_vector=xt)
+        incoming_drive_i += np.ravel(white_noise_i)
+        incoming_drive_i -= ti
+
+        # Recurrent drive: Excitatory drive in the absence of external stimuli
+        recurrent_step = None
+        if recurrent:
+            recurrent_step = (incoming_drive_e - te > 0).astype(np.float32)
+
+        incoming_drive_e += self.v_t
+        incoming_drive_e -= te
+
+        # Heaviside step function, written straight into the output arrays
+        if xt_out is None:
+            xt_out = np.empty_like(incoming_drive_e)
+        if yt_out is None:
+            yt_out = np.empty_like(incoming_drive_i)
+        np.greater(incoming_drive_e, 0.0, out=xt_out)
+        np.greater(incoming_drive_i, 0.0, out=yt_out)
+
+        return recurrent_step, xt_out, yt_out
 
 
 # Simulate / Train SORN
@@ -979,11 +1005,11 @@ class Simulator_(Sorn):
 
     def update_callback_state(self, *args) -> None:
         if self.callbacks:
-            (indices,) = np.array(self.callback_mask).nonzero()
-            keys = [list(self.avail_callbacks.keys())[i] for i in indices]
-
-            values = [args[idx] for idx in indices]
-            for key, val in zip(keys, values):
+            for key, idx in zip(self.callback_keys, self.callback_indices):
+                val = args[idx]
+                # Plasticity updates the weights in place; store a snapshot, not a view of the live state
+                if isinstance(val, np.ndarray):
+                    val = val.copy()
                 self.callback_state[key] = val
 
     def run(
@@ -1069,9 +1095,27 @@ class Simulator_(Sorn):
         Sorn.ni = int(0.2 * Sorn.ne)
 
         plasticity = Plasticity()
+        network_state = NetworkState()
         # Initialize/Get the weight, threshold state and activity vectors
         matrix_collection = MatrixCollection(phase=self.phase, state=self.state)
 
+        # Structural plasticity draws for all time steps at once instead of one RNG call per step
+        sp_draws = np.random.randint(0, 10, self.timesteps)
+
+        # Buffers to get the resulting x and y vectors at each time step and update the master matrix.
+        # Allocated once and refilled in place at every step
+        # Column-major, so that xt_1 and xt are contiguous vectors
+        x_buffer = np.zeros(matrix_collection.X.shape, dtype=np.float32, order="F")
+        y_buffer = np.zeros(matrix_collection.Y.shape, dtype=np.float32, order="F")
+
+        # Noise buffers refilled in place at every step by a generator seeded from np.random
+        if noise:
+            rng = np.random.default_rng(np.random.randint(2**31))
+            white_noise_e = np.empty(x_buffer.shape[0], dtype=np.float32)
+            white_noise_i = np.empty(y_buffer.shape[0], dtype=np.float32)
+        else:
+            white_noise_e, white_noise_i = 0.0, 0.0
+
         if self.callbacks:
             assert isinstance(self.callbacks, list), "Callbacks must be a list"
             assert all(isinstance(callback, str) for callback in self.callbacks)
@@ -1080,11 +1124,22 @@ class Simulator_(Sorn):
             ).astype(int)
             self.callback_state = dict.fromkeys(self.callbacks, None)
 
+            # Positions of the requested callbacks in the update_callback_state arguments, computed once
+            (self.callback_indices,) = np.nonzero(self.callback_mask)
+            avail_keys = list(self.avail_callbacks.keys())
+            self.callback_keys = [avail_keys[idx] for idx in self.callback_indices]
+
             # Requested values to be collected and returned
             self.dispatcher = Callbacks(
                 self.timesteps, self.avail_callbacks, self.callbacks
             )
 
+        # Connection counts scan the full weight matrices; count only if a callback collects them
+        count_ei_conn = bool(self.callbacks) and "EIConnectionCounts" in self.callbacks
+        count_ee_conn = bool(self.callbacks) and "EEConnectionCounts" in self.callbacks
+        # Recurrent state is only consumed by the RecurrentActivation callback
+        need_r = bool(self.callbacks) and "RecurrentActivation" in self.callbacks
+
         if self.exc_genesis:
             assert self.num_new_neurons != None, "Number of neurons value missing"
             assert self.neurogenesis_init_step != None, "Neurogenesis step missing"
@@ -1098,130 +1153,135 @@ class Simulator_(Sorn):
                 rmax=self.timesteps,
             )
             print(len(np.unique(self.genesis_times)))
+            neurogenesis = Neurogenesis()
+
+            # Sorted unique genesis times walked with a pointer, one comparison per step
+            genesis_times = np.unique(
+                np.asarray(self.genesis_times, dtype=int)
+            ).tolist()
+            genesis_idx = 0
+
+        # Current weights and thresholds, written back to the matrix collection every step
+        wee, wei, wie = (
+            matrix_collection.Wee,
+            matrix_collection.Wei,
+            matrix_collection.Wie,
+        )
+        te, ti = matrix_collection.Te, matrix_collection.Ti
+
         # To get the last activation status of Exc and Inh neurons
         for i in tqdm(range(self.timesteps)):
 
-            Wee, Wei, Wie = (
-                matrix_collection.Wee,
-                matrix_collection.Wei,
-                matrix_collection.Wie,
-            )
-            Te, Ti = matrix_collection.Te, matrix_collection.Ti
-            X, Y = matrix_collection.X, matrix_collection.Y
-
-            network_state = NetworkState(inputs[:, i])
-
-            # Buffers to get the resulting x and y vectors at the current time step and update the master matrix
-            x_buffer, y_buffer = np.zeros((Wee[i].shape[0], 2)), np.zeros(
-                (Wei[i].shape[0], 2)
-            )
+            network_state.set_input(inputs[:, i])
 
             # Fraction of active connections between E-E and E-I networks
-            ei_conn = (Wei[i] > 0.0).sum()
-            ee_conn = (Wee[i] > 0.0).sum()
+            # Weights are clipped at 0.0, so the positive connections are the non zero ones
+            ei_conn = np.count_nonzero(wei) if count_ei_conn else None
+            ee_conn = np.count_nonzero(wee) if count_ee_conn else None
 
             if noise:
-                white_noise_e = Initializer.white_gaussian_noise(
-                    mu=0.0, sigma=0.04, t=Wee[i].shape[0]
+                Initializer.white_gaussian_noise(
+                    mu=0.0, sigma=0.04, t=wee.shape[0], out=white_noise_e, rng=rng
                 )
-                white_noise_i = Initializer.white_gaussian_noise(
-                    mu=0.0, sigma=0.04, t=Wei[i].shape[0]
+                Initializer.white_gaussian_noise(
+                    mu=0.0, sigma=0.04, t=wei.shape[0], out=white_noise_i, rng=rng
                 )
-            else:
-                white_noise_e, white_noise_i = 0.0, 0.0
-
-            # Recurrent drive
-            r = network_state.recurrent_drive(
-                Wee[i], Wei[i], Te[i], X[i], Y[i], white_noise_e
-            )
-
-            # Get excitatory states and inhibitory states given the weights and thresholds
-            # x(t+1), y(t+1)
-            excitatory_state_xt_buffer = network_state.excitatory_network_state(
-                Wee[i], Wei[i], Te[i], X[i], Y[i], white_noise_e
-            )
-            inhibitory_state_yt_buffer = network_state.inhibitory_network_state(
-                Wie[i], Ti[i], X[i], white_noise_i
-            )
 
             # Update X and Y
-            x_buffer[:, 0] = X[i][:, 1]  # xt -->(becomes) xt_1
-            x_buffer[
-                :, 1
-            ] = excitatory_state_xt_buffer.T  # New_activation; x_buffer --> xt
-
-            y_buffer[:, 0] = Y[i][:, 1]
-            y_buffer[:, 1] = inhibitory_state_yt_buffer.T
+            x_buffer[:, 0] = matrix_collection.X[:, 1]  # xt -->(becomes) xt_1
+            y_buffer[:, 0] = matrix_collection.Y[:, 1]
+
+            # Recurrent drive, excitatory states and inhibitory states given the weights and thresholds
+            # r(t+1), x(t+1), y(t+1); New_activation written into x_buffer --> xt
+            r, _, _ = network_state.step(
+                wee,
+                wei,
+                wie,
+                te,
+                ti,
+                matrix_collection.X,
+                matrix_collection.Y,
+                white_noise_e,
+                white_noise_i,
+                xt_out=x_buffer[:, 1],
+                yt_out=y_buffer[:, 1],
+                recurrent=need_r,
+            )
 
             # Plasticity phase
-            plasticity = Plasticity()
-
             # STDP
             if "stdp" not in self.freeze:
-                Wee[i] = plasticity.stdp(Wee[i], x_buffer, cutoff_weights=(0.0, 1.0))
+                wee = plasticity.stdp(wee, x_buffer, cutoff_weights=(0.0, 1.0))
 
             # Intrinsic plasticity
             if "ip" not in self.freeze:
-                Te[i] = plasticity.ip(Te[i], x_buffer)
+                te = plasticity.ip(te, x_buffer)
 
             # Structural plasticity
             if "sp" not in self.freeze:
-                Wee[i] = plasticity.structural_plasticity(Wee[i])
+                wee = plasticity.structural_plasticity(wee, p_c=sp_draws[i])
 
             # iSTDP
             if "istdp" not in self.freeze:
-                Wei[i] = plasticity.istdp(
-                    Wei[i], x_buffer, y_buffer, cutoff_weights=(0.0, 1.0)
+                wei = plasticity.istdp(
+                    wei, x_buffer, y_buffer, cutoff_weights=(0.0, 1.0)
                 )
 
             # TODO: Test condition for neurogenesis
             if self.exc_genesis:
                 # Check genesis time
-                if i in self.genesis_times:
+                if genesis_idx < len(genesis_times) and i == genesis_times[genesis_idx]:
+                    genesis_idx += 1
                     # Check for inhibitory neurogenesis
                     if (Sorn.ne > self.ne_init) and ((Sorn.ne + 1) % 5 == 0):
                         self.inh_genesis = True
                     else:
                         self.inh_genesis = False
-                    neurogenesis = Neurogenesis()
                     (
                         x_buffer,
                         y_buffer,
-                        Wee[i],
-                        Wei[i],
-                        Wie[i],
-                        Te[i],
-                        Ti[i],
+                        wee,
+                        wei,
+                        wie,
+                        te,
+                        ti,
                     ) = neurogenesis.step(
                         exc_pool=self.exc_genesis,
                         inh_pool=self.inh_genesis,
                         x_buffer=x_buffer,
                         y_buffer=y_buffer,
-                        wee=Wee[i],
-                        wei=Wei[i],
-                        wie=Wie[i],
-                        te=Te[i],
-                        ti=Ti[i],
+                        wee=wee,
+                        wei=wei,
+                        wie=wie,
+                        te=te,
+                        ti=ti,
                     )
 
+                    # Network size changed; refresh the size dependent rates (ne, h_ip)
+                    plasticity = Plasticity()
+                    if noise:
+                        # Grow the noise buffers with the pools
+                        white_noise_e = np.empty(wee.shape[0], dtype=np.float32)
+                        white_noise_i = np.empty(wei.shape[0], dtype=np.float32)
+
             # Synaptic scaling Wee
             if "ss" not in self.freeze:
-                Wee[i] = plasticity.ss(Wee[i])
-                Wei[i] = plasticity.ss(Wei[i])
+                wee = plasticity.ss(wee)
+                wei = plasticity.ss(wei)
 
             # Assign the state to the matrix collections
-            matrix_collection.weight_matrix(Wee[i], Wei[i], Wie[i], i)
-            matrix_collection.threshold_matrix(Te[i], Ti[i], i)
+            matrix_collection.weight_matrix(wee, wei, wie, i)
+            matrix_collection.threshold_matrix(te, ti, i)
             matrix_collection.network_activity_t(x_buffer, y_buffer, i)
             if self.callbacks:
                 self.update_callback_state(
                     x_buffer[:, 1],
                     y_buffer[:, 1],
-                    r,
-                    Wee[i],
-                    Wei[i],
-                    Te[i],
-                    Ti[i],
+                    r[:, None] if need_r else None,
+                    wee,
+                    wei,
+                    te,
+                    ti,
                     ei_conn,
                     ee_conn,
                 )
@@ -1229,15 +1289,15 @@ class Simulator_(Sorn):
                 self.dispatcher.step(self.callback_state, time_step=i)
 
         plastic_state = {
-            "Wee": matrix_collection.Wee[-1],
-            "Wei": matrix_collection.Wei[-1],
-            "Wie": matrix_collection.Wie[-1],
-            "Te": matrix_collection.Te[-1],
-            "Ti": matrix_collection.Ti[-1],
-            "X": X[-1],
-            "Y": Y[-1],
+            "Wee": matrix_collection.Wee,
+            "Wei": matrix_collection.Wei,
+            "Wie": matrix_collection.Wie,
+            "Te": matrix_collection.Te,
+            "Ti": matrix_collection.Ti,
+            "X": matrix_collection.X,
+            "Y": matrix_collection.Y,
         }
-        print(matrix_collection.Wee[-1].shape)
+        print(matrix_collection.Wee.shape)
         if self.callbacks:
             return plastic_state, self.dispatcher.get()
         else:
@@ -1263,11 +1323,11 @@ class Trainer_(Sorn):
 
     def update_callback_state(self, *args) -> None:
         if self.callbacks:
-            (indices,) = np.array(self.callback_mask).nonzero()
-            keys = [list(self.avail_callbacks.keys())[i] for i in indices]
-
-            values = [args[idx] for idx in indices]
-            for key, val in zip(keys, values):
+            for key, idx in zip(self.callback_keys, self.callback_indices):
+                val = args[idx]
+                # Plasticity updates the weights in place; store a snapshot, not a view of the live state
+                if isinstance(val, np.ndarray):
+                    val = val.copy()
                 self.callback_state[key] = val
 
     def train_sorn(
@@ -1344,8 +1404,27 @@ class Trainer_(Sorn):
         self.inputs = np.asarray(inputs)
         self.freeze = [] if freeze == None else freeze
         self.callbacks = callbacks
+        plasticity = Plasticity()
+        network_state = NetworkState()
         matrix_collection = MatrixCollection(phase=self.phase, state=self.state)
 
+        # Structural plasticity draws for all time steps at once instead of one RNG call per step
+        sp_draws = np.random.randint(0, 10, self.timesteps)
+
+        # Buffers to get the resulting x and y vectors at each time step and update the master matrix.
+        # Allocated once and refilled in place at every step
+        # Column-major, so that xt_1 and xt are contiguous vectors
+        x_buffer = np.zeros(matrix_collection.X.shape, dtype=np.float32, order="F")
+        y_buffer = np.zeros(matrix_collection.Y.shape, dtype=np.float32, order="F")
+
+        # Noise buffers refilled in place at every step by a generator seeded from np.random
+        if noise:
+            rng = np.random.default_rng(np.random.randint(2**31))
+            white_noise_e = np.empty(x_buffer.shape[0], dtype=np.float32)
+            white_noise_i = np.empty(y_buffer.shape[0], dtype=np.float32)
+        else:
+            white_noise_e, white_noise_i = 0.0, 0.0
+
         if self.callbacks:
             assert isinstance(self.callbacks, list), "Callbacks must be a list"
             assert all(isinstance(callback, str) for callback in self.callbacks)
@@ -1354,106 +1433,111 @@ class Trainer_(Sorn):
             ).astype(int)
             self.callback_state = dict.fromkeys(self.callbacks, None)
 
+            # Positions of the requested callbacks in the update_callback_state arguments, computed once
+            (self.callback_indices,) = np.nonzero(self.callback_mask)
+            avail_keys = list(self.avail_callbacks.keys())
+            self.callback_keys = [avail_keys[idx] for idx in self.callback_indices]
+
             # Requested values to be collected and returned
             self.dispatcher = Callbacks(
                 self.timesteps, self.avail_callbacks, self.callbacks
             )
 
+        # Connection counts scan the full weight matrices; count only if a callback collects them
+        count_ei_conn = bool(self.callbacks) and "EIConnectionCounts" in self.callbacks
+        count_ee_conn = bool(self.callbacks) and "EEConnectionCounts" in self.callbacks
+        # Recurrent state is only consumed by the RecurrentActivation callback
+        need_r = bool(self.callbacks) and "RecurrentActivation" in self.callbacks
+
+        # Current weights and thresholds, written back to the matrix collection every step
+        wee, wei, wie = (
+            matrix_collection.Wee,
+            matrix_collection.Wei,
+            matrix_collection.Wie,
+        )
+        te, ti = matrix_collection.Te, matrix_collection.Ti
+
         for i in range(self.timesteps):
 
             if noise:
-                white_noise_e = Initializer.white_gaussian_noise(
-                    mu=0.0, sigma=0.04, t=Sorn.ne
+                Initializer.white_gaussian_noise(
+                    mu=0.0, sigma=0.04, t=wee.shape[0], out=white_noise_e, rng=rng
                 )
-                white_noise_i = Initializer.white_gaussian_noise(
-                    mu=0.0, sigma=0.04, t=Sorn.ni
+                Initializer.white_gaussian_noise(
+                    mu=0.0, sigma=0.04, t=wei.shape[0], out=white_noise_i, rng=rng
                 )
-            else:
-                white_noise_e = 0.0
-                white_noise_i = 0.0
-
-            network_state = NetworkState(self.inputs[:, i])
-
-            # Buffers to get the resulting x and y vectors at the current time step and update the master matrix
-            x_buffer, y_buffer = np.zeros((Sorn.ne, 2)), np.zeros((Sorn.ni, 2))
 
-            Wee, Wei, Wie = (
-                matrix_collection.Wee,
-                matrix_collection.Wei,
-                matrix_collection.Wie,
-            )
-            Te, Ti = matrix_collection.Te, matrix_collection.Ti
-            X, Y = matrix_collection.X, matrix_collection.Y
+            network_state.set_input(self.inputs[:, i])
 
             # Fraction of active connections between E-E and E-I networks
-            ei_conn = (Wei[i] > 0.0).sum()
-            ee_conn = (Wee[i] > 0.0).sum()
-
-            # Recurrent drive at t+1 used to predict the next external stimuli
-            r = network_state.recurrent_drive(
-                Wee[i], Wei[i], Te[i], X[i], Y[i], white_noise_e=white_noise_e
-            )
-
-            # Get excitatory states and inhibitory states given the weights and thresholds
-            # x(t+1), y(t+1)
-            excitatory_state_xt_buffer = network_state.excitatory_network_state(
-                Wee[i], Wei[i], Te[i], X[i], Y[i], white_noise_e=white_noise_e
-            )
-            inhibitory_state_yt_buffer = network_state.inhibitory_network_state(
-                Wie[i], Ti[i], X[i], white_noise_i=white_noise_i
-            )
+            # Weights are clipped at 0.0, so the positive connections are the non zero ones
+            ei_conn = np.count_nonzero(wei) if count_ei_conn else None
+            ee_conn = np.count_nonzero(wee) if count_ee_conn else None
 
             # Update X and Y
-            x_buffer[:, 0] = X[i][:, 1]  # xt -->xt_1
-            x_buffer[:, 1] = excitatory_state_xt_buffer.T  # x_buffer --> xt
-            y_buffer[:, 0] = Y[i][:, 1]
-            y_buffer[:, 1] = inhibitory_state_yt_buffer.T
+            x_buffer[:, 0] = matrix_collection.X[:, 1]  # xt -->xt_1
+            y_buffer[:, 0] = matrix_collection.Y[:, 1]
+
+            # Recurrent drive at t+1 used to predict the next external stimuli, and
+            # excitatory states and inhibitory states given the weights and thresholds
+            # r(t+1), x(t+1), y(t+1) written into x_buffer --> xt
+            r, _, _ = network_state.step(
+                wee,
+                wei,
+                wie,
+                te,
+                ti,
+                matrix_collection.X,
+                matrix_collection.Y,
+                white_noise_e=white_noise_e,
+                white_noise_i=white_noise_i,
+                xt_out=x_buffer[:, 1],
+                yt_out=y_buffer[:, 1],
+                recurrent=need_r,
+            )
 
             if self.phase == "plasticity":
                 # Plasticity phase
-                plasticity = Plasticity()
                 # STDP
                 if "stdp" not in self.freeze:
-                    Wee[i] = plasticity.stdp(
-                        Wee[i], x_buffer, cutoff_weights=(0.0, 1.0)
-                    )
+                    wee = plasticity.stdp(wee, x_buffer, cutoff_weights=(0.0, 1.0))
 
                 # Intrinsic plasticity
                 if "ip" not in self.freeze:
-                    Te[i] = plasticity.ip(Te[i], x_buffer)
+                    te = plasticity.ip(te, x_buffer)
 
                 # Structural plasticity
                 if "sp" not in self.freeze:
-                    Wee[i] = plasticity.structural_plasticity(Wee[i])
+                    wee = plasticity.structural_plasticity(wee, p_c=sp_draws[i])
 
                 # iSTDP
                 if "istdp" not in self.freeze:
-                    Wei[i] = plasticity.istdp(
-                        Wei[i], x_buffer, y_buffer, cutoff_weights=(0.0, 1.0)
+                    wei = plasticity.istdp(
+                        wei, x_buffer, y_buffer, cutoff_weights=(0.0, 1.0)
                     )
 
                 # Synaptic scaling Wee
                 if "ss" not in self.freeze:
-                    Wee[i] = plasticity.ss(Wee[i])
-                    Wei[i] = plasticity.ss(Wei[i])
+                    wee = plasticity.ss(wee)
+                    wei = plasticity.ss(wei)
 
             else:
-                # Wee[i], Wei[i], Te[i] remain same
+                # wee, wei, te remain same
                 pass
 
             # Assign the state to the matrix collections
-            matrix_collection.weight_matrix(Wee[i], Wei[i], Wie[i], i)
-            matrix_collection.threshold_matrix(Te[i], Ti[i], i)
+            matrix_collection.weight_matrix(wee, wei, wie, i)
+            matrix_collection.threshold_matrix(te, ti, i)
             matrix_collection.network_activity_t(x_buffer, y_buffer, i)
             if self.callbacks:
                 self.update_callback_state(
                     x_buffer[:, 1],
                     y_buffer[:, 1],
-                    r,
-                    Wee[i],
-                    Wei[i],
-                    Te[i],
-                    Ti[i],
+                    r[:, None] if need_r else None,
+                    wee,
+                    wei,
+                    te,
+                    ti,
                     ei_conn,
                     ee_conn,
                 )
@@ -1461,13 +1545,13 @@ class Trainer_(Sorn):
                 self.dispatcher.step(self.callback_state, time_step=i)
 
         plastic_state = {
-            "Wee": matrix_collection.Wee[-1],
-            "Wei": matrix_collection.Wei[-1],
-            "Wie": matrix_collection.Wie[-1],
-            "Te": matrix_collection.Te[-1],
-            "Ti": matrix_collection.Ti[-1],
-            "X": X[-1],
-            "Y": Y[-1],
+            "Wee": matrix_collection.Wee,
+            "Wei": matrix_collection.Wei,
+            "Wie": matrix_collection.Wie,
+            "Te": matrix_collection.Te,
+            "Ti": matrix_collection.Ti,
+            "X": matrix_collection.X,
+            "Y": matrix_collection.Y,
         }
 
         if self.callbacks:
@@ -227,11 +227,9 @@ class Initializer(object):
                 # ---------- Update the connection weight matrix ------------
 
                 # Update incoming connection weights for selected 'neuron'
-
-                for incoming_idx, incoming_weight in enumerate(incoming_weights_neuron):
-                    connection_weights[possible_incoming_connections[incoming_idx]][
-                        neuron
-                    ] = incoming_weight
+                connection_weights[
+                    possible_incoming_connections, neuron
+                ] = incoming_weights_neuron
 
                 global_incoming_weights_idx += lambdas_incoming[neuron]
 
@@ -279,14 +277,10 @@ class Initializer(object):
 
                 # ---------- Update the connection weight matrix ------------
 
-                # Update outgoing connections for the neuron
-
-                for outgoing_idx, outgoing_weight in enumerate(
-                    outgoing_weights
-                ):  # Update the columns in the connection matrix
-                    connection_weights[neuron][
-                        possible_outgoing_connections[outgoing_idx]
-                    ] = outgoing_weight
+                # Update outgoing connections for the neuron: the columns in the connection matrix
+                connection_weights[
+                    neuron, possible_outgoing_connections
+                ] = outgoing_weights
 
                 # Update the global weight values index
                 global_outgoing_weights_idx += lambdas[neuron]
@@ -373,21 +367,46 @@ class Initializer(object):
             wee (array):  Weight matrix
 
         Returns:
-            list (indices): (row_idx,col_idx)"""
-
-        i, j = np.where(wee <= 0.0)
-        indices = list(zip(i, j))
+            array (indices): (row_idx,col_idx) pairs, self connections excluded"""
 
-        self_conn_removed = []
-        for i, idxs in enumerate(indices):
+        indices = np.argwhere(wee <= 0.0)
 
-            if idxs[0] != idxs[1]:
-                self_conn_removed.append(indices[i])
+        # Remove self connections i == j
+        self_conn_removed = indices[indices[:, 0] != indices[:, 1]]
 
         return self_conn_removed
 
     @staticmethod
-    def white_gaussian_noise(mu: float, sigma: float, t: int):
+    def get_random_unconnected_index(wee: np.array, num_draws: int = 32):
+        """Randomly select a single unconnected pair i!=j for Structural plasticity.
+        Random pairs are drawn and the first unconnected one is accepted, which is uniform
+        over the unconnected pairs. Falls back to get_unconnected_indexes if none is found
+
+        Args:
+            wee (array):  Weight matrix
+
+            num_draws (int, optional): Number of random pairs drawn before the fallback. Defaults to 32.
+
+        Returns:
+            tuple (index): (row_idx,col_idx) or None if every pair is connected"""
+
+        rows = np.random.randint(0, wee.shape[0], num_draws)
+        cols = np.random.randint(0, wee.shape[1], num_draws)
+        (hits,) = np.nonzero((wee[rows, cols] <= 0.0) & (rows != cols))
+        if len(hits):
+            return rows[hits[0]], cols[hits[0]]
+
+        # Densely connected matrix; scan for the remaining candidates
+        indexes = Initializer.get_unconnected_indexes(wee)
+        if len(indexes):
+            return tuple(indexes[np.random.randint(len(indexes))])
+
+        return None
+
+    @staticmethod
+    def white_gaussian_noise(
+        mu: float, sigma: float, t: int, out: np.array = None, rng=None
+    ):
 
         """Generates white gaussian noise with mean mu, standard deviation sigma and
         the noise length equals t
@@ -399,13 +418,28 @@ class Initializer(object):
 
             t (int): Length of noise vector
 
+            out (array, optional): Preallocated float32 array of length t filled in place. Defaults to None.
+
+            rng (Generator, optional): Generator used to fill out. Required when out is given.
+
         Returns:
             array: White gaussian noise of length t
         """
 
-        noise = np.random.normal(mu, sigma, t)
+        if out is None:
+            # Single precision to match the network state it is added to
+            noise = np.random.normal(mu, sigma, t).astype(np.float32)
+
+            return np.expand_dims(noise, 1)
+
+        # Fill the preallocated buffer in place instead of allocating a new array
+        assert out.shape == (t,), "Noise buffer length must equal t"
+        assert rng is not None, "Generator missing for the noise buffer"
+        rng.standard_normal(out=out, dtype=np.float32)
+        out *= sigma
+        out += mu
 
-        return np.expand_dims(noise, 1)
+        return out
 
     @staticmethod
     def zero_sum_incoming_check(weights: np.array):
@@ -1,7 +1,7 @@
 import unittest
 import pickle
 import numpy as np
-from sorn.sorn import Trainer, Simulator
+from sorn.sorn import Trainer, Simulator, Sorn, Neurogenesis
 from sorn.utils import Plotter, Statistics
 
 # Getting back the pickled matrices:
@@ -40,6 +40,24 @@ class TestNeurogenesis(unittest.TestCase):
             ),
         )
 
+    def test_new_synapses(self):
+        # Each synapse of a newborn excitatory neuron gets its own sampled weight
+        ne, ni = Sorn.ne, Sorn.ni
+        Sorn.timesteps = 1
+        wee = np.zeros((ne, ne), dtype=np.float32)
+        wei = np.zeros((ni, ne), dtype=np.float32)
+        wie = np.zeros((ne, ni), dtype=np.float32)
+        temp_ee, temp_ei, temp_ie = Neurogenesis().excitatory(wee, wei, wie)
+        Sorn.ne = ne
+
+        self.assertEqual(temp_ee.shape, (ne + 1, ne + 1))
+        self.assertEqual(temp_ei.shape, (ni, ne + 1))
+        self.assertEqual(temp_ie.shape, (ne + 1, ni))
+        self.assertEqual(temp_ee.dtype, np.float32)
+        self.assertEqual(np.count_nonzero(temp_ee[-1]), Sorn.lambda_ee)
+        self.assertEqual(len(np.unique(temp_ee[-1][temp_ee[-1] > 0])), Sorn.lambda_ee)
+        self.assertEqual(np.count_nonzero(temp_ee[:, -1]), Sorn.lambda_ee)
+
 # Run 
 
 # def train():
@@ -1,7 +1,7 @@
 import unittest
 import pickle
 import numpy as np
-from sorn.sorn import Trainer, Simulator
+from sorn.sorn import Trainer, Simulator, Sorn, Plasticity, NetworkState
 from sorn.utils import Plotter, Statistics
 
 # Getting back the pickled matrices:
@@ -184,6 +184,112 @@ class TestSorn(unittest.TestCase):
             ),
         )
 
+    def test_plasticity(self):
+        """Test the plasticity rules against their element-wise definitions"""
+
+        Sorn.timesteps = 1
+        plasticity = Plasticity()
+        wee = np.array([[0.0, 0.2, 0.3], [0.4, 0.0, 0.0], [0.1, 0.5, 0.0]])
+        wei = np.array([[0.3, 0.0, 0.2], [0.0, 0.6, 0.1]])
+
+        def expected_stdp(wee, x):
+            # STDP: wee[j][i] += eta_stdp * (xt[i] * xt_1[j] - xt_1[i] * xt[j]) for connected j->i
+            expected = wee.copy()
+            for i in range(3):
+                for j in range(3):
+                    if wee[j][i] != 0.0:
+                        expected[j][i] += plasticity.eta_stdp * (
+                            x[i, 1] * x[j, 0] - x[i, 0] * x[j, 1]
+                        )
+            return expected
+
+        def expected_istdp(wei, x, y):
+            # iSTDP: wei[j][i] += -eta_inhib * yt_1[j] * (1 - xt[i] * (1 + 1 / mu_ip)) for connected j->i
+            expected = wei.copy()
+            for i in range(3):
+                for j in range(2):
+                    if wei[j][i] != 0.0:
+                        expected[j][i] += (
+                            -plasticity.eta_inhib
+                            * y[j, 0]
+                            * (1 - x[i, 1] * (1 + 1 / plasticity.mu_ip))
+                        )
+            return expected
+
+        x = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+        y = np.array([[1.0, 0.0], [1.0, 1.0]])
+        np.testing.assert_allclose(
+            plasticity.stdp(wee.copy(), x, cutoff_weights=(0.0, 1.0)),
+            expected_stdp(wee, x),
+        )
+        np.testing.assert_allclose(
+            plasticity.istdp(wei.copy(), x, y, cutoff_weights=(0.0, 1.0)),
+            expected_istdp(wei, x, y),
+        )
+
+        # Excitatory neuron 1 and inhibitory neuron 1 are silent when their synapses
+        # would be updated, so those synapses must be left untouched
+        x = np.array([[1.0, 0.0], [0.0, 0.0], [1.0, 1.0]])
+        y = np.array([[1.0, 0.0], [0.0, 1.0]])
+        np.testing.assert_allclose(
+            plasticity.stdp(wee.copy(), x, cutoff_weights=(0.0, 1.0)),
+            expected_stdp(wee, x),
+        )
+        np.testing.assert_allclose(
+            plasticity.istdp(wei.copy(), x, y, cutoff_weights=(0.0, 1.0)),
+            expected_istdp(wei, x, y),
+        )
+
+        # Neurons 0 and 2 fire at t-1 and t, so the connected pairs 0->2 and 2->0 fall in
+        # both the potentiation and depression blocks and are written twice
+        x = np.array([[1.0, 1.0], [0.0, 1.0], [1.0, 1.0]])
+        np.testing.assert_allclose(
+            plasticity.stdp(wee.copy(), x, cutoff_weights=(0.0, 1.0)),
+            expected_stdp(wee, x),
+        )
+
+        # Structural plasticity: the only unconnected pair i!=j gets the new connection
+        wee = np.full((3, 3), 0.5)
+        wee[2][0] = 0.0
+        expected = wee.copy()
+        expected[2][0] = 0.001
+        np.testing.assert_allclose(
+            plasticity.structural_plasticity(wee.copy(), p_c=0), expected
+        )
+        wee[2][0] = 0.5
+        np.testing.assert_allclose(
+            plasticity.structural_plasticity(wee.copy(), p_c=0), wee
+        )
+
+    def test_network_state(self):
+        """Test the single pass network step against the individual network states"""
+
+        defaults = Sorn.ne, Sorn.ni, Sorn.nu
+        Sorn.ne, Sorn.ni, Sorn.nu, Sorn.timesteps = 20, 4, 5, 1
+        network_state = NetworkState(np.random.rand(5))
+        wee = np.random.rand(20, 20).astype(np.float32)
+        wei = np.random.rand(4, 20).astype(np.float32)
+        wie = np.random.rand(20, 4).astype(np.float32)
+        te = np.random.rand(20, 1).astype(np.float32)
+        ti = np.random.rand(4, 1).astype(np.float32)
+        x = (np.random.rand(20, 2) > 0.5).astype(np.float32)
+        y = (np.random.rand(4, 2) > 0.5).astype(np.float32)
+        noise_e = np.random.normal(0.0, 0.04, (20, 1)).astype(np.float32)
+        noise_i = np.random.normal(0.0, 0.04, (4, 1)).astype(np.float32)
+
+        r, xt, yt = network_state.step(wee, wei, wie, te, ti, x, y, noise_e, noise_i)
+        np.testing.assert_array_equal(
+            r, network_state.recurrent_drive(wee, wei, te, x, y, noise_e)[:, 0]
+        )
+        np.testing.assert_array_equal(
+            xt,
+            network_state.excitatory_network_state(wee, wei, te, x, y, noise_e)[:, 0],
+        )
+        np.testing.assert_array_equal(
+            yt, network_state.inhibitory_network_state(wie, ti, x, noise_i)[:, 0]
+        )
+        Sorn.ne, Sorn.ni, Sorn.nu = defaults
+
     def test_plotter(self):
         """Test the Plotter class methods in utils module"""
 